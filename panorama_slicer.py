@@ -2,13 +2,18 @@
 Panorama Slicer - Cut large panoramas into printable 8.5x11" landscape pages
 Navigation: Mouse drag to pan, scroll wheel to zoom, arrow keys to pan
 Click a page cell to export it, or use buttons to export all/visible pages
+Requires Pillow and numpy (pip install pillow numpy); optional: numba for faster
+zoomed-out views, pywin32 for printing
 """
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from PIL import Image, ImageTk, ImageDraw, ImageWin
+from PIL import Image, ImageTk, ImageWin
+import numpy as np
 import os
 import math
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import win32print
@@ -18,10 +23,87 @@ try:
 except ImportError:
     HAS_WIN32 = False
 
+try:
+    from numba import njit, prange, types
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # Page dimensions in inches (landscape)
 PAGE_WIDTH_INCHES = 11
 PAGE_HEIGHT_INCHES = 8.5
 
+# Page layout derived from start point and direction, recomputed when the layout changes
+PageGeometry = namedtuple("PageGeometry", ["start_x", "dir_sign"])
+
+# Downsampled view levels are built by halving the image until it is at most this wide
+PYRAMID_MIN_WIDTH = 2048
+
+# Below this zoom the view is downscaled with the box-average kernel (if numba is available)
+BOX_DOWNSCALE_MAX_ZOOM = 0.25
+
+if HAS_NUMBA:
+    # Explicit signature compiles eagerly at import (or loads from the on-disk cache).
+    # np.asarray() of a PIL image is read-only, hence the readonly source array type.
+    @njit(types.void(types.Array(types.uint8, 3, "C", readonly=True), types.uint8[:, :, ::1],
+                     types.int64, types.int64),
+          cache=True, parallel=True, fastmath=True, boundscheck=False)
+    def box_downscale(src, dst, sx, sy):
+        """Downscale an RGB uint8 array into dst by averaging sx*sy source blocks."""
+        src_h, src_w = src.shape[0], src.shape[1]
+        dst_h, dst_w = dst.shape[0], dst.shape[1]
+        for oy in prange(dst_h):
+            y0 = oy * src_h // dst_h
+            y1 = min(y0 + sy, src_h)
+            for ox in range(dst_w):
+                x0 = ox * src_w // dst_w
+                x1 = min(x0 + sx, src_w)
+                r = 0
+                g = 0
+                b = 0
+                for y in range(y0, y1):
+                    for x in range(x0, x1):
+                        r += src[y, x, 0]
+                        g += src[y, x, 1]
+                        b += src[y, x, 2]
+                count = (y1 - y0) * (x1 - x0)
+                dst[oy, ox, 0] = r // count
+                dst[oy, ox, 1] = g // count
+                dst[oy, ox, 2] = b // count
+
+
+def extract_page(image, left, right, page_width, pad_left):
+    """Crop one page out of the image, padded with white to page_width (on the left for RTL)."""
+    page = image.crop((left, 0, right, image.height))
+    if page.width >= page_width:
+        return page
+
+    # Pad the edge page onto a white page in its own mode
+    white = "white"
+    if page.mode in ("I", "I;16", "I;16B", "I;16L"):
+        white = 65535
+    elif page.mode == "CMYK":
+        white = (0, 0, 0, 0)
+    elif page.mode == "P":
+        try:
+            white = page.palette.getcolor((255, 255, 255), page)
+        except ValueError:
+            # Palette is full and has no white - only this edge page loses the palette
+            page = page.convert("RGB")
+    full_page = Image.new(page.mode, (page_width, page.height), white)
+    if page.mode == "P":
+        full_page.putpalette(page.palette)
+    full_page.paste(page, (page_width - page.width, 0) if pad_left else (0, 0))
+    return full_page
+
+
+def save_page(image, left, right, page_width, pad_left, output_path):
+    """Extract one page and save it as PNG (safe to run in a worker thread)."""
+    page = extract_page(image, left, right, page_width, pad_left)
+    if page.mode == "CMYK":
+        page = page.convert("RGB")  # PNG has no CMYK
+    page.save(output_path, "PNG", compress_level=1)
+
 
 class PanoramaSlicer:
     def __init__(self, root):
@@ -31,6 +113,7 @@ class PanoramaSlicer:
 
         # Image state
         self.original_image = None
+        self.pyramid = []  # original_image followed by successive 2x reductions, for the view
         self.image_path = None
         self.img_width = 0
         self.img_height = 0
@@ -42,13 +125,17 @@ class PanoramaSlicer:
         self.drag_start_x = 0
         self.drag_start_y = 0
         self.is_dragging = False
+        self._resize_cache = (None, None)  # (crop box + display size + resample, resized image)
+        self._redraw_pending = False  # A coalesced refresh is scheduled via after_idle
+        self._resize_after_id = None  # Pending debounced refresh after window resize
+        self._image_id = None  # Persistent canvas image item, its image is swapped on refresh
+        self._exporting = False  # A background export is running (see export_pages_async)
 
         # Grid settings
         self.show_grid = tk.BooleanVar(value=True)
         self.right_to_left = tk.BooleanVar(value=True)  # Start from right end
         self.start_offset = 0  # Custom start position (from right if RTL, from left if LTR)
         self.grid_color = "#FF0000"
-        self.grid_alpha = 128
 
         # Output settings
         self.output_dir = None
@@ -143,13 +230,14 @@ class PanoramaSlicer:
 
     def load_image(self, path):
         self.status_label.config(text=f"Loading {os.path.basename(path)}...")
-        self.root.update()
+        self.root.update_idletasks()
 
         try:
             # Load full image
             self.original_image = Image.open(path)
             self.original_image.load()  # Force load into memory
             self.image_path = path
+            self._resize_cache = (None, None)
             self.img_width, self.img_height = self.original_image.size
 
             # Calculate page dimensions based on image height = 8.5 inches
@@ -165,6 +253,7 @@ class PanoramaSlicer:
             self.pages_x = math.ceil(self.img_width / self.page_width_px)
             self.pages_y = 1  # Height already fits
             total_pages = self.pages_x
+            self._recompute_page_bounds()
 
             # Update info
             self.info_label.config(
@@ -177,6 +266,8 @@ class PanoramaSlicer:
             if not self.output_dir:
                 self.output_dir = os.path.dirname(path)
 
+            self.build_pyramid()
+
             # Fit to window
             self.fit_to_window()
 
@@ -186,6 +277,16 @@ class PanoramaSlicer:
             messagebox.showerror("Error", f"Failed to load image: {e}")
             self.status_label.config(text="Error loading image")
 
+    def build_pyramid(self):
+        """Build half-resolution view levels so zoomed-out views resize from a smaller source."""
+        self.pyramid = [self.original_image]
+        level = self.original_image
+        if level.mode not in ("L", "LA", "RGB", "RGBA"):
+            level = level.convert("RGB")
+        while level.width > PYRAMID_MIN_WIDTH:
+            level = level.reduce(2)
+            self.pyramid.append(level)
+
     def fit_to_window(self):
         if not self.original_image:
             return
@@ -217,7 +318,7 @@ class PanoramaSlicer:
         if not self.original_image:
             return
 
-        self.canvas.delete("all")
+        self.canvas.delete("grid")
 
         canvas_w = self.canvas.winfo_width()
         canvas_h = self.canvas.winfo_height()
@@ -238,68 +339,75 @@ class PanoramaSlicer:
         right = int(min(self.pan_x + view_w, self.img_width))
         bottom = int(min(self.pan_y + view_h, self.img_height))
 
-        # Extract and resize visible portion
-        crop = self.original_image.crop((left, top, right, bottom))
         display_w = int((right - left) * self.zoom)
         display_h = int((bottom - top) * self.zoom)
 
         if display_w > 0 and display_h > 0:
-            resized = crop.resize((display_w, display_h), Image.Resampling.NEAREST if self.zoom > 0.5 else Image.Resampling.BILINEAR)
+            # Extract and resize visible portion, reusing the last result if nothing changed
+            resample = Image.Resampling.NEAREST if self.zoom > 0.5 else Image.Resampling.BILINEAR
+            # Pick the smallest pyramid level that still has at least 2x the display resolution
+            lvl = min(len(self.pyramid) - 1, max(0, int(-math.log2(self.zoom)) - 1))
+            key = (left, top, right, bottom, display_w, display_h, resample, lvl)
+            if key != self._resize_cache[0]:
+                level = self.pyramid[lvl]
+                scale = 2 ** lvl
+                crop = level.crop((left // scale, top // scale,
+                                   min(level.width, -(-right // scale)), min(level.height, -(-bottom // scale))))
+                if HAS_NUMBA and self.zoom < BOX_DOWNSCALE_MAX_ZOOM and crop.mode == "RGB":
+                    src = np.asarray(crop)
+                    out = np.empty((display_h, display_w, 3), np.uint8)
+                    box_downscale(src, out, max(1, src.shape[1] // display_w), max(1, src.shape[0] // display_h))
+                    resized = Image.fromarray(out)
+                else:
+                    resized = crop.resize((display_w, display_h), resample)
+                self._resize_cache = (key, resized)
+                self.display_image = ImageTk.PhotoImage(resized)
+
+            if self._image_id is None:
+                self._image_id = self.canvas.create_image(0, 0, anchor=tk.NW, image=self.display_image)
+            else:
+                self.canvas.itemconfig(self._image_id, image=self.display_image)
 
-            # Draw grid overlay if enabled
+            # Draw grid as canvas items on top of the image (no per-frame pixel compositing)
             if self.show_grid.get():
-                resized = resized.convert("RGBA")
-                overlay = Image.new("RGBA", resized.size, (0, 0, 0, 0))
-                draw = ImageDraw.Draw(overlay)
-
-                # Calculate grid lines in view coordinates (vertical lines for page boundaries)
-                if self.right_to_left.get():
-                    # RTL: grid lines start from custom start point (or right edge)
-                    start_x = self.img_width - self.start_offset
-                    for px in range(self.pages_x + 1):
-                        x_img = start_x - px * self.page_width_px
-                        x_view = (x_img - self.pan_x) * self.zoom
-                        if 0 <= x_view <= display_w:
-                            # First line (start point) in green, others in red
-                            color = (0, 255, 0, 200) if px == 0 else (255, 0, 0, 200)
-                            draw.line([(x_view, 0), (x_view, display_h)], fill=color, width=2)
-                else:
-                    # LTR: grid lines start from custom start point (or left edge)
-                    start_x = self.start_offset
-                    for px in range(self.pages_x + 1):
-                        x_img = start_x + px * self.page_width_px
-                        x_view = (x_img - self.pan_x) * self.zoom
-                        if 0 <= x_view <= display_w:
-                            color = (0, 255, 0, 200) if px == 0 else (255, 0, 0, 200)
-                            draw.line([(x_view, 0), (x_view, display_h)], fill=color, width=2)
-
-                # Draw page numbers
-                for px in range(self.pages_x):
-                    page_num = px + 1
-                    if self.right_to_left.get():
-                        start_x = self.img_width - self.start_offset
-                        x_img = start_x - px * self.page_width_px - self.page_width_px // 2
-                    else:
-                        start_x = self.start_offset
-                        x_img = start_x + px * self.page_width_px + self.page_width_px // 2
-
-                    y_img = self.page_height_px // 2
-                    x_view = (x_img - self.pan_x) * self.zoom
-                    y_view = (y_img - self.pan_y) * self.zoom
-                    if 0 <= x_view <= display_w and 0 <= y_view <= display_h:
-                        text = f"{page_num}"
-                        draw.rectangle([x_view-20, y_view-10, x_view+20, y_view+10],
-                                     fill=(0, 0, 0, 150))
-                        draw.text((x_view-10, y_view-8), text, fill=(255, 255, 255, 255))
-
-                resized = Image.alpha_composite(resized, overlay)
-                resized = resized.convert("RGB")
-
-            self.display_image = ImageTk.PhotoImage(resized)
-            self.canvas.create_image(0, 0, anchor=tk.NW, image=self.display_image)
+                self.draw_grid(display_w, display_h)
+        elif self._image_id is not None:
+            self.canvas.itemconfig(self._image_id, image="")
 
         self.zoom_label.config(text=f"{self.zoom*100:.1f}%")
 
+    def schedule_refresh(self):
+        """Coalesce bursts of pan/zoom events into a single refresh once Tk is idle."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        self._redraw_pending = False
+        self.refresh_view()
+
+    def draw_grid(self, display_w, display_h):
+        """Draw page boundaries and page numbers as canvas items tagged "grid"."""
+        # Vertical lines at page boundaries, starting from the custom start point (or edge)
+        x_view = (self.page_bounds_x - self.pan_x) * self.zoom
+        visible = np.flatnonzero((x_view >= 0) & (x_view <= display_w))
+        for px, xv in zip(visible.tolist(), x_view[visible].tolist()):
+            # First line (start point) in green, others in red
+            color = "#00FF00" if px == 0 else self.grid_color
+            self.canvas.create_line(xv, 0, xv, display_h, fill=color, width=2, tags="grid")
+
+        # Draw page numbers
+        y_img = self.page_height_px // 2
+        y_view = (y_img - self.pan_y) * self.zoom
+        if not 0 <= y_view <= display_h:
+            return
+        x_view = (self.page_center_x - self.pan_x) * self.zoom
+        visible = np.flatnonzero((x_view >= 0) & (x_view <= display_w))
+        for px, xv in zip(visible.tolist(), x_view[visible].tolist()):
+            self.canvas.create_rectangle(xv-20, y_view-10, xv+20, y_view+10,
+                                         fill="#000000", outline="", stipple="gray50", tags="grid")
+            self.canvas.create_text(xv, y_view, text=f"{px + 1}", fill="#FFFFFF", tags="grid")
+
     def on_mouse_down(self, event):
         self.drag_start_x = event.x
         self.drag_start_y = event.y
@@ -316,7 +424,7 @@ class PanoramaSlicer:
 
         self.pan_x = self.drag_pan_x - dx / self.zoom
         self.pan_y = self.drag_pan_y - dy / self.zoom
-        self.refresh_view()
+        self.schedule_refresh()
 
     def on_mouse_up(self, event):
         if not self.is_dragging and self.original_image:
@@ -344,9 +452,16 @@ class PanoramaSlicer:
         self.pan_x = mouse_x_img - event.x / self.zoom
         self.pan_y = mouse_y_img - event.y / self.zoom
 
-        self.refresh_view()
+        self.schedule_refresh()
 
     def on_resize(self, event):
+        # Debounce: a window drag fires many Configure events, only redraw once it settles
+        if self._resize_after_id:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(50, self._on_resize_settled)
+
+    def _on_resize_settled(self):
+        self._resize_after_id = None
         self.refresh_view()
 
     def on_mouse_move(self, event):
@@ -354,16 +469,7 @@ class PanoramaSlicer:
             return
 
         # Calculate which page the mouse is over
-        img_x = self.pan_x + event.x / self.zoom
-
-        if self.right_to_left.get():
-            start_x = self.img_width - self.start_offset
-            dist_from_start = start_x - img_x
-        else:
-            start_x = self.start_offset
-            dist_from_start = img_x - start_x
-
-        page_num = int(dist_from_start // self.page_width_px) + 1
+        page_num = self.page_at(self.pan_x + event.x / self.zoom)
 
         if 1 <= page_num <= self.pages_x:
             self.page_info_label.config(text=f"Page {page_num} of {self.pages_x} | L-click: export | R-click: set start")
@@ -390,6 +496,7 @@ class PanoramaSlicer:
         # Recalculate number of pages
         remaining_width = self.img_width - self.start_offset
         self.pages_x = math.ceil(remaining_width / self.page_width_px)
+        self._recompute_page_bounds()
 
         self.status_label.config(text=f"Start point set. {self.pages_x} pages from this position.")
         self.refresh_view()
@@ -399,6 +506,7 @@ class PanoramaSlicer:
         self.start_offset = 0
         if self.original_image:
             self.pages_x = math.ceil(self.img_width / self.page_width_px)
+            self._recompute_page_bounds()
         self.refresh_view()
         self.status_label.config(text="Start point reset to edge.")
 
@@ -406,124 +514,140 @@ class PanoramaSlicer:
         """Reset start when direction changes."""
         self.reset_start()
 
+    def _recompute_page_bounds(self):
+        """Precompute page boundary x-coordinates after the page layout changes."""
+        if self.right_to_left.get():
+            # RTL: page 1 starts at start_offset from right edge
+            start_x, dir_sign = round(self.img_width - self.start_offset), -1
+        else:
+            # LTR: page 1 starts at start_offset from left edge
+            start_x, dir_sign = round(self.start_offset), 1
+        self._geom = PageGeometry(start_x, dir_sign)
+
+        # Boundaries in page order: page N spans page_bounds_x[N-1]..page_bounds_x[N]
+        offsets = np.arange(self.pages_x + 1, dtype=np.int32) * self.page_width_px
+        self.page_bounds_x = (start_x + dir_sign * offsets).astype(np.int32)
+        self.page_center_x = self.page_bounds_x[:-1] + dir_sign * (self.page_width_px // 2)
+        # Ascending search key so page range lookups don't depend on direction
+        self._page_bounds_key = dir_sign * self.page_bounds_x
+
+    def page_at(self, img_x):
+        """Get the 1-based page number at an image x-coordinate (out of range if outside the grid)."""
+        geom = self._geom
+        return int((img_x - geom.start_x) * geom.dir_sign // self.page_width_px) + 1
+
+    def page_extent(self, page_num):
+        """Get the (left, right) image x-range of a page, clipped to the image."""
+        a = int(self.page_bounds_x[page_num - 1])
+        b = int(self.page_bounds_x[page_num])
+        return max(0, min(a, b)), min(self.img_width, max(a, b))
+
     def pan_by(self, dx, dy):
         if not self.original_image:
             return
         self.pan_x += dx / self.zoom
         self.pan_y += dy / self.zoom
-        self.refresh_view()
+        self.schedule_refresh()
 
     def export_clicked_page(self, canvas_x, canvas_y):
         if not self.original_image or not self.output_dir:
             messagebox.showwarning("Warning", "Please load an image and set output directory first")
             return
 
-        img_x = self.pan_x + canvas_x / self.zoom
-
-        if self.right_to_left.get():
-            start_x = self.img_width - self.start_offset
-            dist_from_start = start_x - img_x
-        else:
-            start_x = self.start_offset
-            dist_from_start = img_x - start_x
+        if self._exporting:
+            messagebox.showwarning("Warning", "An export is already in progress")
+            return
 
-        page_num = int(dist_from_start // self.page_width_px) + 1
+        page_num = self.page_at(self.pan_x + canvas_x / self.zoom)
 
         if 1 <= page_num <= self.pages_x:
             self.export_page(page_num)
 
     def export_page(self, page_num):
         """Export a page by page number (1-based)."""
+        left, right = self.page_extent(page_num)
+        output_path = self.page_output_path(page_num)
+        save_page(self.original_image, left, right, self.page_width_px, self.right_to_left.get(), output_path)
 
-        if self.right_to_left.get():
-            # RTL: page 1 starts at start_offset from right edge
-            start_x = self.img_width - self.start_offset
-            right = start_x - (page_num - 1) * self.page_width_px
-            left = max(0, right - self.page_width_px)
-        else:
-            # LTR: page 1 starts at start_offset from left edge
-            start_x = self.start_offset
-            left = start_x + (page_num - 1) * self.page_width_px
-            right = min(left + self.page_width_px, self.img_width)
-
-        top = 0
-        bottom = self.img_height
-
-        # Crop the page
-        page_img = self.original_image.crop((left, top, right, bottom))
-
-        # If edge page is narrower, pad with white to maintain exact page width
-        if page_img.size[0] != self.page_width_px:
-            full_page = Image.new(self.original_image.mode, (self.page_width_px, self.page_height_px), (255, 255, 255))
-            if self.right_to_left.get():
-                # Pad on the left side for RTL (partial page is leftmost)
-                full_page.paste(page_img, (self.page_width_px - page_img.size[0], 0))
-            else:
-                # Pad on the right side for LTR (partial page is rightmost)
-                full_page.paste(page_img, (0, 0))
-            page_img = full_page
+        self.status_label.config(text=f"Exported: {os.path.basename(output_path)}")
 
-        # Generate filename
+    def page_output_path(self, page_num):
+        """Get the PNG path a page is exported to."""
         base_name = os.path.splitext(os.path.basename(self.image_path))[0]
         filename = f"{base_name}_page{page_num:03d}.png"
-        output_path = os.path.join(self.output_dir, filename)
-
-        # Save with high quality
-        page_img.save(output_path, "PNG", compress_level=1)
-
-        self.status_label.config(text=f"Exported: {filename}")
+        return os.path.join(self.output_dir, filename)
 
     def export_all_pages(self):
         if not self.original_image or not self.output_dir:
             messagebox.showwarning("Warning", "Please load an image and set output directory first")
             return
 
+        if self._exporting:
+            messagebox.showwarning("Warning", "An export is already in progress")
+            return
+
         total = self.pages_x
         if not messagebox.askyesno("Confirm", f"Export all {total} pages?"):
             return
 
-        for page_num in range(1, self.pages_x + 1):
-            self.export_page(page_num)
-            self.status_label.config(text=f"Exporting page {page_num}/{total}...")
-            self.root.update()
+        self.export_pages_async(range(1, self.pages_x + 1), f"Exported all {total} pages to {self.output_dir}")
+
+    def export_pages_async(self, page_numbers, done_text):
+        """Save pages on a background thread pool, reporting progress from the Tk main loop."""
+        # PNG encoding releases the GIL, so pages are cropped and saved in worker threads
+        # while the UI keeps handling pan/zoom events
+        image = self.original_image
+        rtl = self.right_to_left.get()
+        self._exporting = True
+
+        executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        futures = []
+        for page_num in page_numbers:
+            left, right = self.page_extent(page_num)
+            futures.append(executor.submit(save_page, image, left, right, self.page_width_px,
+                                           rtl, self.page_output_path(page_num)))
+        executor.shutdown(wait=False)  # Queued pages still run; threads exit when done
+
+        self.status_label.config(text=f"Exporting page 0/{len(futures)}...")
+        self.root.after(50, self._poll_export, futures, done_text)
+
+    def _poll_export(self, futures, done_text):
+        done = sum(f.done() for f in futures)
+        if done < len(futures):
+            self.status_label.config(text=f"Exporting page {done}/{len(futures)}...")
+            self.root.after(50, self._poll_export, futures, done_text)
+            return
+
+        self._exporting = False
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            self.status_label.config(text="Export failed")
+            messagebox.showerror("Error", f"Failed to export {len(errors)} pages: {errors[0]}")
+            return
 
-        self.status_label.config(text=f"Exported all {total} pages to {self.output_dir}")
-        messagebox.showinfo("Complete", f"Exported {total} pages")
+        self.status_label.config(text=done_text)
+        messagebox.showinfo("Complete", f"Exported {len(futures)} pages")
 
     def export_visible_pages(self):
         if not self.original_image or not self.output_dir:
             messagebox.showwarning("Warning", "Please load an image and set output directory first")
             return
 
-        canvas_w = self.canvas.winfo_width()
-
-        # Calculate visible page range
-        view_left = self.pan_x
-        view_right = self.pan_x + canvas_w / self.zoom
-
-        if self.right_to_left.get():
-            start_x = self.img_width - self.start_offset
-            start_page = max(1, int((start_x - view_right) // self.page_width_px) + 1)
-            end_page = min(self.pages_x, int((start_x - view_left) // self.page_width_px) + 1)
-        else:
-            start_x = self.start_offset
-            start_page = max(1, int((view_left - start_x) // self.page_width_px) + 1)
-            end_page = min(self.pages_x, int((view_right - start_x) // self.page_width_px) + 1)
+        if self._exporting:
+            messagebox.showwarning("Warning", "An export is already in progress")
+            return
 
-        count = end_page - start_page + 1
+        pages = self.get_visible_page_numbers()
+        if not pages:
+            messagebox.showwarning("Warning", "No pages visible")
+            return
+        start_page, end_page = pages[0], pages[-1]
+        count = len(pages)
 
         if not messagebox.askyesno("Confirm", f"Export {count} visible pages ({start_page}-{end_page})?"):
             return
 
-        exported = 0
-        for page_num in range(start_page, end_page + 1):
-            self.export_page(page_num)
-            exported += 1
-            self.status_label.config(text=f"Exporting page {page_num} ({exported}/{count})...")
-            self.root.update()
-
-        self.status_label.config(text=f"Exported {count} visible pages to {self.output_dir}")
-        messagebox.showinfo("Complete", f"Exported {count} pages")
+        self.export_pages_async(pages, f"Exported {count} visible pages to {self.output_dir}")
 
     def show_print_dialog(self):
         """Show print options dialog."""
@@ -627,21 +751,16 @@ class PanoramaSlicer:
         view_left = self.pan_x
         view_right = self.pan_x + canvas_w / self.zoom
 
-        if self.right_to_left.get():
-            start_x = self.img_width - self.start_offset
-            start_page = max(1, int((start_x - view_right) // self.page_width_px) + 1)
-            end_page = min(self.pages_x, int((start_x - view_left) // self.page_width_px) + 1)
-        else:
-            start_x = self.start_offset
-            start_page = max(1, int((view_left - start_x) // self.page_width_px) + 1)
-            end_page = min(self.pages_x, int((view_right - start_x) // self.page_width_px) + 1)
+        pages = np.searchsorted(self._page_bounds_key, self._geom.dir_sign * np.array([view_left, view_right]), "right")
+        start_page = max(1, int(pages.min()))
+        end_page = min(self.pages_x, int(pages.max()))
 
         return list(range(start_page, end_page + 1))
 
     def print_pages(self, page_numbers, fit_to_page=True, printer_name=None, single_sided=True):
         """Print specified pages to the specified printer."""
         self.status_label.config(text="Preparing to print...")
-        self.root.update()
+        self.root.update_idletasks()
 
         try:
             # Use default printer if none specified
@@ -674,8 +793,10 @@ class PanoramaSlicer:
 
             # Print each page as separate job to prevent duplex
             for i, page_num in enumerate(page_numbers):
-                self.status_label.config(text=f"Printing page {page_num} ({i+1}/{len(page_numbers)})...")
-                self.root.update()
+                # Repaint the status every few pages without pumping input events mid-job
+                if i % 8 == 0:
+                    self.status_label.config(text=f"Printing page {page_num} ({i+1}/{len(page_numbers)})...")
+                    self.root.update_idletasks()
 
                 # Create fresh DC for each page/job
                 hdc = win32ui.CreateDC()
@@ -711,6 +832,10 @@ class PanoramaSlicer:
                     new_w, new_h = img_w, img_h
                     x, y = 0, 0
 
+                # Pre-scale downsized pages so GDI gets a 1:1 blit from a smaller DIB
+                if new_w < img_w:
+                    page_img = page_img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+
                 # Start print job for this single page
                 hdc.StartDoc(f"Panorama Page {page_num}")
                 hdc.StartPage()
@@ -733,31 +858,8 @@ class PanoramaSlicer:
 
     def get_page_image(self, page_num):
         """Get a page image by number (without saving to file)."""
-        if self.right_to_left.get():
-            start_x = self.img_width - self.start_offset
-            right = start_x - (page_num - 1) * self.page_width_px
-            left = max(0, right - self.page_width_px)
-        else:
-            start_x = self.start_offset
-            left = start_x + (page_num - 1) * self.page_width_px
-            right = min(left + self.page_width_px, self.img_width)
-
-        top = 0
-        bottom = self.img_height
-
-        page_img = self.original_image.crop((left, top, right, bottom))
-
-        # Pad if needed
-        if page_img.size[0] != self.page_width_px:
-            full_page = Image.new(self.original_image.mode,
-                                 (self.page_width_px, self.page_height_px), (255, 255, 255))
-            if self.right_to_left.get():
-                full_page.paste(page_img, (self.page_width_px - page_img.size[0], 0))
-            else:
-                full_page.paste(page_img, (0, 0))
-            page_img = full_page
-
-        return page_img
+        left, right = self.page_extent(page_num)
+        return extract_page(self.original_image, left, right, self.page_width_px, self.right_to_left.get())
 
 
 def main():